@@ -6,6 +6,26 @@ import os # This package is used to display the workspace and to change it if ne
 # The default file name of the database is assigned
 habit_database = "habits_db.json"
 
+# Every time at least this many changes have been written to the change history, a complete copy of the habits is stored as a checkpoint.
+# A query for a past date then only has to replay the changes after the nearest checkpoint instead of the whole history.
+# As each checkpoint contains all habits, the distance between two checkpoints is at least half the number of habits at that time.
+# A checkpoint is therefore never larger than twice the changes since the previous one, so all checkpoints together take up 
+# at most about twice as much space as the history itself. A query replays at most max(25, half the number of habits) changes.
+history_checkpoint_interval = 25
+
+# The state of the current session for grouping changes and for undo/redo. It is only kept in memory and is not saved in the database.
+# - transaction_open: Whether a group of changes has been started that has not yet been saved or discarded
+# - pending_operations: The changes of the open group, which are only written to the file when the group is saved
+# - history_length: The length of the change history at the start of the group, so that a discarded group leaves no trace in it
+# - undo_stack / redo_stack: Saved groups of changes that can be undone or redone. Each group is a list of small operations, not a copy of the database.
+edit_session = {
+    "transaction_open": False,
+    "pending_operations": [],
+    "history_length": 0,
+    "undo_stack": [],
+    "redo_stack": []
+}
+
 # Functions that are defined within classes are called methods. 
 # They make sense when working directly with attributes of the class or instance.
 # Here a class is defined in order to have a defined blueprint for the habits to be saved.
@@ -85,11 +105,20 @@ def load_database():
     """
     try:
         with open(habit_database, "r") as file_with_database: # "r", as the file should only be opened in read mode at this point.
-            return json.load(file_with_database) # In order for the content of the file to be recognized as JSON data.
+            database = json.load(file_with_database) # In order for the content of the file to be recognized as JSON data.
     except FileNotFoundError: #  If the file does not exist, repeat exception handling so that the program doesn't crash.
-        return {"habits": []} # If the file was not found, the function returns a dictionary containing the key “habits” with an empty list as value. 
+        database = {"habits": []} # If the file was not found, a dictionary containing the key “habits” with an empty list as value is used.
     # This is a standardized return to ensure that the rest of the program can still work with a valid structure (e.g. an empty list of habits).
 
+    # Databases that were created before the change history existed only contain the habits themselves.
+    # In this case the history is rebuilt once from the start and completion dates that are stored in the habits.
+    if "history" not in database:
+        database["history"], database["checkpoints"] = build_history_from_habits(database["habits"])
+    # The same applies to the statistics tables, which are calculated once from all habits and afterwards only updated.
+    if "statistics" not in database:
+        database["statistics"] = build_statistics(database["habits"])
+    return database
+
 # Function to save the database file
 def save_database(database):
     """
@@ -100,6 +129,365 @@ def save_database(database):
         json.dump(database, file_with_database, indent=1) # Ensures that an indentation of one space takes place.
         # This indentation makes the JSON file easier for people to read.
 
+# The following functions maintain the change history of the database. Each change (adding, completing or deleting a habit)
+# is stored as a small entry with the date on which it took place. This makes it possible to find out what the habits looked like on any past date.
+def apply_history_entry(habits_by_id, entry):
+    """
+    This function applies a single entry of the change history to a dictionary of habits, in which the habits are stored under their ID.
+    There are three kinds of entries:
+    - add: A new habit was created
+    - complete: The completion status of a habit was changed
+    - delete: A habit was deleted
+    """
+    if entry["action"] == "add":
+        habits_by_id[entry["habit"]["id"]] = dict(entry["habit"]) # A copy is stored so that the history itself is never changed afterwards.
+    elif entry["action"] == "complete":
+        if entry["id"] in habits_by_id:
+            habits_by_id[entry["id"]]["completed"] = entry["completed"]
+            habits_by_id[entry["id"]]["completed_date"] = entry["completed_date"]
+    elif entry["action"] == "delete":
+        habits_by_id.pop(entry["id"], None) # None prevents an error if the habit is already missing.
+
+
+def create_checkpoint(habits_by_id, date, position):
+    """
+    This function creates a checkpoint, i.e. a complete copy of all habits at a certain point in the change history.
+    The position indicates how many entries of the history are already contained in the checkpoint.
+    """
+    return {
+        "date": date,
+        "position": position,
+        "habits": [dict(habits_by_id[habit_id]) for habit_id in sorted(habits_by_id)]
+    }
+
+
+def checkpoint_is_due(checkpoints, history_length, number_of_habits):
+    """
+    This function checks whether a new checkpoint should be created. This is the case if, since the last checkpoint, 
+    at least history_checkpoint_interval changes and at least half as many changes as there are habits have been added to the history.
+    """
+    last_position = checkpoints[-1]["position"] if checkpoints else 0
+    return history_length - last_position >= max(history_checkpoint_interval, number_of_habits // 2)
+
+
+def build_history_from_habits(habits):
+    """
+    This function rebuilds the change history and the checkpoints from the existing habits. 
+    It is only needed once for databases that were saved before the change history was introduced.
+    Each habit receives an entry on its start date and, if it has been completed, a second entry on its completion date.
+    Habits that were deleted before the introduction of the history can no longer be reconstructed.
+    """
+    history = []
+    for habit_data in habits:
+        added_habit = dict(habit_data, completed=False, completed_date=None) # When a habit is added, it has not yet been completed.
+        added_date = habit_data["start_date"] or habit_data["deadline"]
+        history.append({"date": added_date, "action": "add", "habit": added_habit})
+        if habit_data["completed"]:
+            # Some habits were marked as completed before their start date. The completion is then noted on the start date, 
+            # as otherwise it would come before the habit was added when the history is replayed.
+            completed_on = max(habit_data["completed_date"] or added_date, added_date)
+            history.append({"date": completed_on, "action": "complete",
+                            "id": habit_data["id"], "completed": True, "completed_date": habit_data["completed_date"]})
+    # sort() is stable, so that a habit is always added before it is completed, even if both happen on the same day.
+    history.sort(key=lambda entry: entry["date"])
+
+    # The checkpoints are created while the history is replayed once.
+    checkpoints = []
+    habits_by_id = {}
+    for position, entry in enumerate(history, start=1):
+        apply_history_entry(habits_by_id, entry)
+        if checkpoint_is_due(checkpoints, position, len(habits_by_id)):
+            checkpoints.append(create_checkpoint(habits_by_id, entry["date"], position))
+    return history, checkpoints
+
+
+def record_change(database, entry):
+    """
+    This function adds an entry to the change history of the database. 
+    The date of the change is set to the current day. If enough changes have been made since the last checkpoint, a new checkpoint is created.
+    """
+    entry = dict({"date": datetime.now().strftime('%Y-%m-%d')}, **entry) # The date is placed in front so that the entries in the file are easy to read.
+    database["history"].append(entry)
+    if checkpoint_is_due(database["checkpoints"], len(database["history"]), len(database["habits"])):
+        habits_by_id = {habit_data["id"]: habit_data for habit_data in database["habits"]}
+        database["checkpoints"].append(create_checkpoint(habits_by_id, entry["date"], len(database["history"])))
+
+
+def database_as_of(database, as_of_date):
+    """
+    This function returns the database as it looked at the end of a certain day (format YYYY-MM-DD). 
+    The most recent checkpoint that is not later than this day is used as a starting point. 
+    Only the changes that were made after this checkpoint and up to this day are then replayed.
+    The returned database can be used by all functions that display habits.
+    """
+    starting_point = None
+    for checkpoint in reversed(database["checkpoints"]): # The search starts with the newest checkpoint.
+        if checkpoint["date"] <= as_of_date:
+            starting_point = checkpoint
+            break
+
+    if starting_point:
+        habits_by_id = {habit_data["id"]: dict(habit_data) for habit_data in starting_point["habits"]}
+        position = starting_point["position"]
+    else: # If there is no suitable checkpoint, the history must be replayed from the beginning.
+        habits_by_id = {}
+        position = 0
+
+    for entry in database["history"][position:]:
+        # The history is sorted by date. As soon as an entry is later than the requested day, all further entries are too.
+        if entry["date"] > as_of_date:
+            break
+        apply_history_entry(habits_by_id, entry)
+
+    return {"habits": [habits_by_id[habit_id] for habit_id in sorted(habits_by_id)]}
+
+
+# The following functions maintain the statistics tables of the database. For each day, each week and each month there is a table
+# which counts for each habit name and frequency how many habits were completed, how many were still open at their deadline and how many were active.
+# The tables are updated with every change, so that the statistics never have to be calculated from all habits again.
+# So that habits with a long duration do not create an entry for every single day, the daily table does not store the active habits at all, 
+# only the habits that started or ended on a day. The active habits of a day are calculated from these values and the weekly table (see daily_active).
+def period_keys(date):
+    """
+    This function returns the keys of the day, the week and the month to which a date (format YYYY-MM-DD) belongs.
+    The weeks are numbered according to the ISO calendar, e.g. 2025-W04.
+    """
+    date_value = datetime.strptime(date, '%Y-%m-%d')
+    iso_year, iso_week, _ = date_value.isocalendar() # The day of the week is not required
+    return {
+        "daily": date,
+        "weekly": f"{iso_year}-W{iso_week:02d}",
+        "monthly": date[:7] # The first seven characters of the date are the year and the month (YYYY-MM)
+    }
+
+
+def add_to_statistics(statistics, keys, habit_data, counter, amount):
+    """
+    This function adds an amount (1 or -1) to a counter of a habit in the given statistics tables.
+    Counters that have dropped to zero are removed again so that the tables remain small.
+    """
+    for granularity, key in keys.items():
+        habits_in_period = statistics[granularity].setdefault(key, {})
+        counters = habits_in_period.setdefault(habit_data["name"], {}).setdefault(habit_data["frequency"], {})
+        counters[counter] = counters.get(counter, 0) + amount
+        if counters[counter] == 0:
+            del counters[counter]
+        if not counters:
+            del habits_in_period[habit_data["name"]][habit_data["frequency"]]
+            if not habits_in_period[habit_data["name"]]:
+                del habits_in_period[habit_data["name"]]
+            if not habits_in_period:
+                del statistics[granularity][key]
+
+
+def update_statistics(statistics, habit_data, amount):
+    """
+    This function adds (amount 1) or removes (amount -1) a habit in its current state to or from the statistics tables:
+    - active: The habit counts as active in every week and month between its start date and its deadline
+    - started / ended: In the daily table, the habit is counted on its start date and on its deadline
+    - completed: A completed habit is counted on the day, week and month of its completion
+    - open_due: A habit that has not been completed is counted on the day, week and month of its deadline. 
+      Once the deadline has passed, these habits are the timeouts of the period.
+    """
+    start = datetime.strptime(habit_data["start_date"] or habit_data["deadline"], '%Y-%m-%d')
+    deadline = datetime.strptime(habit_data["deadline"], '%Y-%m-%d')
+    if start <= deadline: # A habit without any active day is not counted as active, started or ended
+        add_to_statistics(statistics, {"daily": start.strftime('%Y-%m-%d')}, habit_data, "started", amount)
+        add_to_statistics(statistics, {"daily": habit_data["deadline"]}, habit_data, "ended", amount)
+
+        # The weeks are run through from week to week, starting with the Monday of the week of the start date,
+        # so that the effort depends on the number of weeks and not on the number of days.
+        monday = start - timedelta(days=start.weekday())
+        while monday <= deadline:
+            add_to_statistics(statistics, {"weekly": period_keys(monday.strftime('%Y-%m-%d'))["weekly"]}, habit_data, "active", amount)
+            monday += timedelta(weeks=1)
+
+        # The same applies to the months, which are run through from month to month.
+        year, month = start.year, start.month
+        while (year, month) <= (deadline.year, deadline.month):
+            add_to_statistics(statistics, {"monthly": f"{year}-{month:02d}"}, habit_data, "active", amount)
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    update_completion_statistics(statistics, habit_data, amount)
+
+
+def update_completion_statistics(statistics, habit_data, amount):
+    """
+    This function only adds or removes the completion status of a habit (the completed and open_due counters) to or from the statistics tables.
+    It is used on its own when a habit is marked as completed, as the period in which the habit is active does not change.
+    """
+    if habit_data["completed"] and habit_data["completed_date"]:
+        add_to_statistics(statistics, period_keys(habit_data["completed_date"]), habit_data, "completed", amount)
+    elif not habit_data["completed"]:
+        add_to_statistics(statistics, period_keys(habit_data["deadline"]), habit_data, "open_due", amount)
+
+
+def build_statistics(habits):
+    """
+    This function calculates the statistics tables once from all habits. 
+    It is only needed for databases that were saved before the statistics were introduced.
+    """
+    statistics = {"daily": {}, "weekly": {}, "monthly": {}}
+    for habit_data in habits:
+        update_statistics(statistics, habit_data, 1)
+    return statistics
+
+
+# All changes to the habits are described as small operations (dictionaries) and carried out via the following function.
+# For each operation there is an inverse operation that reverses it, which is what makes undo, redo and discarding a group of changes possible.
+def apply_operation(database, operation, record_history=True):
+    """
+    This function carries out an operation on the habits in the database. There are three kinds of operations:
+    - add: The habit stored in the operation is inserted at the stored position
+    - delete: The habit with the ID of the stored habit is removed
+    - complete: The completion status of a habit is set to the values stored under “after”
+    If record_history is True, the change is also noted in the change history.
+    """
+    if operation["action"] == "add":
+        database["habits"].insert(operation["index"], dict(operation["habit"]))
+        update_statistics(database["statistics"], operation["habit"], 1)
+        if record_history:
+            record_change(database, {"action": "add", "habit": operation["habit"]})
+    elif operation["action"] == "delete":
+        habit_id = operation["habit"]["id"]
+        habit_data = next((habits for habits in database["habits"] if habits["id"] == habit_id), None)
+        if habit_data: # The habit is removed from the statistics in the state in which it is currently stored
+            update_statistics(database["statistics"], habit_data, -1)
+        database["habits"] = [habit for habit in database["habits"] if habit["id"] != habit_id]
+        if record_history:
+            record_change(database, {"action": "delete", "id": habit_id})
+    elif operation["action"] == "complete":
+        habit_data = next((habits for habits in database["habits"] if habits["id"] == operation["id"]), None)
+        if habit_data:
+            # The old completion status is removed from the statistics and the new one is added. The active counters remain unchanged.
+            update_completion_statistics(database["statistics"], habit_data, -1)
+            habit_data["completed"] = operation["after"]["completed"]
+            habit_data["completed_date"] = operation["after"]["completed_date"]
+            update_completion_statistics(database["statistics"], habit_data, 1)
+            if record_history:
+                record_change(database, {"action": "complete", "id": operation["id"], 
+                                         "completed": habit_data["completed"], "completed_date": habit_data["completed_date"]})
+
+
+def invert_operation(operation):
+    """
+    This function returns the operation that reverses the given operation. 
+    Adding and deleting reverse each other, for a change of the completion status the values before and after are swapped.
+    """
+    if operation["action"] == "add":
+        return dict(operation, action="delete")
+    elif operation["action"] == "delete":
+        return dict(operation, action="add")
+    return dict(operation, before=operation["after"], after=operation["before"]) # action "complete"
+
+
+def perform_operation(database, operation):
+    """
+    This function is called by the menu functions to carry out a change. 
+    If a group of changes is open, the change is only collected and saved later together with the whole group.
+    Otherwise the change is saved immediately and can be undone on its own.
+    """
+    apply_operation(database, operation)
+    if edit_session["transaction_open"]:
+        edit_session["pending_operations"].append(operation)
+    else:
+        edit_session["undo_stack"].append([operation])
+        edit_session["redo_stack"].clear() # After a new change, previously undone changes can no longer be redone.
+        save_database(database)
+
+
+# Function to start a group of changes
+def begin_transaction(database):
+    """
+    This function starts a group of changes. All changes that are made afterwards (adding, completing and deleting habits) 
+    are only written to the database file when the group is saved. Until then, the whole group can be discarded.
+    """
+    if edit_session["transaction_open"]:
+        print("A group of changes has already been started.")
+        return
+    edit_session["transaction_open"] = True
+    edit_session["pending_operations"] = []
+    edit_session["history_length"] = len(database["history"])
+    print("A group of changes has been started. The changes are saved when you save the group.")
+
+
+# Function to save a group of changes
+def commit_transaction(database):
+    """
+    This function saves all changes of the open group to the database file at once. 
+    The group can then be undone as a whole with “Undo the last change”.
+    """
+    if not edit_session["transaction_open"]:
+        print("There is no open group of changes.")
+        return
+    edit_session["transaction_open"] = False
+    operations = edit_session["pending_operations"]
+    edit_session["pending_operations"] = []
+    if operations: # An empty group does not need to be saved and is not added to the undo list
+        edit_session["undo_stack"].append(operations)
+        edit_session["redo_stack"].clear()
+        save_database(database) # All changes of the group are written with a single save
+    print(f"The group of changes has been saved ({len(operations)} changes).")
+
+
+# Function to discard a group of changes
+def rollback_transaction(database):
+    """
+    This function discards all changes of the open group. The habits are reset to the state at the start of the group.
+    As the changes had not yet been saved, the database file remains unchanged.
+    """
+    if not edit_session["transaction_open"]:
+        print("There is no open group of changes.")
+        return
+    # The changes are reversed in reverse order. They are not noted in the change history, 
+    # instead the history is shortened to its length at the start of the group, as if the changes had never taken place.
+    for operation in reversed(edit_session["pending_operations"]):
+        apply_operation(database, invert_operation(operation), record_history=False)
+    del database["history"][edit_session["history_length"]:]
+    database["checkpoints"] = [checkpoint for checkpoint in database["checkpoints"] if checkpoint["position"] <= edit_session["history_length"]]
+    print(f"The group of changes has been discarded ({len(edit_session['pending_operations'])} changes).")
+    edit_session["transaction_open"] = False
+    edit_session["pending_operations"] = []
+
+
+# Function to undo the last saved change (or group of changes)
+def undo_last_change(database):
+    """
+    This function undoes the last saved change. If the last change was a group of changes, the whole group is undone.
+    The undone change can be restored with “Redo the last undone change”.
+    """
+    if edit_session["transaction_open"]: # Otherwise the open group would be mixed with the change that is undone
+        print("Please save or discard the open group of changes first.")
+        return
+    if not edit_session["undo_stack"]:
+        print("There is no change that can be undone.")
+        return
+    operations = edit_session["undo_stack"].pop()
+    for operation in reversed(operations):
+        apply_operation(database, invert_operation(operation))
+    edit_session["redo_stack"].append(operations)
+    save_database(database)
+    print(f"The last change has been undone ({len(operations)} changes).")
+
+
+# Function to redo the last undone change (or group of changes)
+def redo_last_change(database):
+    """
+    This function redoes the change that was undone last.
+    """
+    if edit_session["transaction_open"]:
+        print("Please save or discard the open group of changes first.")
+        return
+    if not edit_session["redo_stack"]:
+        print("There is no change that can be redone.")
+        return
+    operations = edit_session["redo_stack"].pop()
+    for operation in operations:
+        apply_operation(database, operation)
+    edit_session["undo_stack"].append(operations)
+    save_database(database)
+    print(f"The last undone change has been redone ({len(operations)} changes).")
+
+
 # Function to create a Habit and assign the characteristics of a Habit
 def create_a_habit(database):
     """
@@ -132,13 +520,15 @@ def create_a_habit(database):
         habit.id = 1
 
     habit.start = datetime.now().strftime('%Y-%m-%d') # Change the format again, JSON cannot save the output of the datetime package directly.
-    database["habits"].append(habit.to_dict()) # Adds the habit to the database. Since the to_dict method is used, it is converted into a dictionary.
-    save_database(database) # The change (i.e. the new habit) is saved in the database file
+    # Adds the habit to the end of the database. Since the to_dict method is used, it is converted into a dictionary.
+    # The change (i.e. the new habit) is noted in the change history and saved in the database file, unless a group of changes is open.
+    perform_operation(database, {"action": "add", "habit": habit.to_dict(), "index": len(database["habits"])})
 
 # Function to display all habits
-def show_habits(database):
+def show_habits(database, as_of_date=None):
     """
-    This function lists all the habits in the database. The following values are output from the database: 
+    This function lists all the habits in the database. If a date (format YYYY-MM-DD) is passed as as_of_date, 
+    the habits are displayed as they were on that day. The following values are output from the database: 
     - The ID of the habit
     - The name of the habit
     - The date when the habit was registered
@@ -148,12 +538,16 @@ def show_habits(database):
     - The status of the habit, which provides information on whether the habit has already been completed.
     - Provided the habit has been completed: The date on which it was completed
     """
+    if as_of_date: # For a past date, the database is first reconstructed as it was on that day
+        database = database_as_of(database, as_of_date)
+        date_today = as_of_date
+    else:
+        date_today = datetime.now().strftime('%Y-%m-%d')
     if not database["habits"]: # This checks whether the dictionary is empty
         print("There are no habits yet.")
         return # To exit the function so that the rest of the code is not executed if the dictionary is empty
     for habit_data in database["habits"]:
         habit = Habit.from_dict(habit_data) # Here, the specific habit is loaded into the habit variable via a query of the class object
-        date_today = datetime.now().strftime('%Y-%m-%d')
         if habit.deadline < date_today and habit.completed == False: # If the deadline is less than today's date and the habit is not yet marked as completed, it should receive the status outdated.
             habit.timeout = True
         else:
@@ -170,9 +564,10 @@ def show_habits(database):
 # I have decided to write the requirements for the analysis of existing habits in different functions in order to keep the individual functions clearer.
 
 # This function returns an enumeration of all habits with the same periodicity
-def show_same_freq_habits(database):
+def show_same_freq_habits(database, as_of_date=None):
     """
     This function lists all habits in the database that have the same repetition interval. 
+    If a date (format YYYY-MM-DD) is passed as as_of_date, the habits are displayed as they were on that day.
     First you must select the interval for which the habits are to be output (daily, weekly or monthly), 
     then the following values are output from the database:
     - The ID of the habit
@@ -182,6 +577,8 @@ def show_same_freq_habits(database):
     - The frequency, i.e. the repetition interval
     - The status of the habit, which provides information on whether the habit has already been completed.
     """
+    if as_of_date: # As in show_habits, the database is reconstructed as it was on the past day
+        database = database_as_of(database, as_of_date)
     if not database["habits"]: # This checks whether the dictionary is empty
         print("There are no habits yet.")
         return # To exit the function so that the rest of the code is not executed if the dictionary is empty
@@ -211,22 +608,28 @@ def mark_habit_as_completed(database, habit_id):
     if habit_data:
         habit = Habit.from_dict(habit_data)
         habit.mark_completed()
-        habit_data["completed"] = True  # Updates the habit status entry in the database
-        habit_data["completed_date"] = datetime.now().strftime('%Y-%m-%d') # Change the format, JSON cannot save the output of the datetime package directly.
-        save_database(database)
+        # Updates the habit status entry in the database. The previous status is kept in the operation so that the change can be undone.
+        perform_operation(database, {"action": "complete", "id": habit_id,
+                                     "before": {"completed": habit_data["completed"], "completed_date": habit_data["completed_date"]},
+                                     "after": {"completed": habit.completed, "completed_date": habit.completed_date}})
         print(f"Habit '{habit.name}' has been marked as completed")
     else:
         print(f"No habit found with ID {habit_id}") # If the ID could not be found, this response is displayed.
 
 
 # Function to check which habits are still to be completed today, as their deadline expires today
-def check_for_urgent_habits(database):
+def check_for_urgent_habits(database, as_of_date=None):
     """
     This function is used to check whether a habit is about to expire on the day of the query.
     This function allows the user to be notified of urgent matters so that they can deal with them in good time.
     habits that are already marked as completed are not displayed as they are no longer urgent.
+    If a date (format YYYY-MM-DD) is passed as as_of_date, the check is carried out as if it were that day.
     """
-    today = datetime.now().strftime('%Y-%m-%d') # The date is formatted again in the format YYYY-MM-DD
+    if as_of_date: # As in show_habits, the database is reconstructed as it was on the past day
+        database = database_as_of(database, as_of_date)
+        today = as_of_date
+    else:
+        today = datetime.now().strftime('%Y-%m-%d') # The date is formatted again in the format YYYY-MM-DD
     deadline_count = 1 # Sets the start value for the loop to 1.
     for habit_data in database["habits"]:
         habit = Habit.from_dict(habit_data)
@@ -251,8 +654,9 @@ def delete_habit(database, habit_id):
     habit_data = next((habits for habits in database["habits"] if habits["id"] == habit_id), None) # Here, next() is used to iterate through the habit database until the corresponding ID is found.
     if habit_data:                                                                                 # Just like the function for marking habits as completed.
         habit = Habit.from_dict(habit_data)
-        database["habits"] = [habit for habit in database["habits"] if habit["id"] != habit_id]
-        save_database(database) # The change (the deletion of the habit) is written to the database file
+        # The deleted habit and its position are kept in the operation so that it can be restored with undo.
+        # The deletion is noted in the change history, so that the habit is still visible for earlier dates.
+        perform_operation(database, {"action": "delete", "habit": dict(habit_data), "index": database["habits"].index(habit_data)})
         print(f"Habit '{habit.name}' has been deleted")
     else:
         print(f"No habit found with ID {habit_id}") # If the ID could not be found, this response is displayed.
@@ -292,11 +696,14 @@ def change_working_directory():
 
 # A function to output the longest habit run series ever. Here the user can display his greatest success.
 
-def longest_streak_overall(database):
+def longest_streak_overall(database, as_of_date=None):
     """
     This function calculates the longest streak of a consecutive completed habit overall.
     A streak is a sequence of successful consecutive completions of a habit.
+    If a date (format YYYY-MM-DD) is passed as as_of_date, only the completions up to and including that day are taken into account.
     """
+    if as_of_date: # Completions after the past day are not yet contained in the reconstructed database
+        database = database_as_of(database, as_of_date)
     if not database["habits"]:  # The following message should be displayed if no habits are available.
         print("There are no habits yet.")
         return
@@ -352,6 +759,152 @@ def longest_streak_overall(database):
         print("There are no streaks of consecutive completed habits.")
 
 
+# This function displays the statistics tables for the most recent days, weeks or months.
+# Only the tables of the displayed periods are read, so the effort does not depend on how many habits have been saved in total.
+def show_statistics(database):
+    """
+    This function displays statistics for the most recent periods. First you must select the repetition interval of the table:
+    - Daily: The last 7 days
+    - Weekly: The last 8 weeks
+    - Monthly: The last 12 months
+    For each period, the following values are output for each habit name and frequency, and in total for each frequency:
+    - Completed: How many habits were completed in the period
+    - Timeouts: How many habits expired in the period without being completed
+    - Active: How many habits were active in the period (between their start date and their deadline)
+    - Completion rate: The share of completed habits in completed habits and timeouts
+    The statistics only contain the habits that are currently saved. If a habit is deleted, it is also removed from all periods, 
+    including weeks and months that are already over, so the statistics of past periods can change afterwards.
+    Undoing the deletion adds the habit back again. To see deleted habits, use “Look back at a past date” instead.
+    """
+    choice = questionary.select(
+        "For which periods should the statistics be displayed?",
+        choices=["Daily", "Weekly", "Monthly"]
+    ).ask()
+    granularity = choice.lower() # The tables are stored under the keys daily, weekly and monthly
+    statistics = database["statistics"][granularity]
+    today = datetime.now()
+    date_today = today.strftime('%Y-%m-%d')
+
+    # The keys of the periods to be displayed are determined, starting with the current period.
+    if granularity == "daily":
+        keys = [period_keys((today - timedelta(days=days_back)).strftime('%Y-%m-%d'))["daily"] for days_back in range(7)]
+    elif granularity == "weekly":
+        keys = [period_keys((today - timedelta(weeks=weeks_back)).strftime('%Y-%m-%d'))["weekly"] for weeks_back in range(8)]
+    else:
+        keys = [f"{today.year - (12 - today.month + months_back) // 12}-{(today.month - months_back - 1) % 12 + 1:02d}" for months_back in range(12)]
+    current_key = keys[0]
+
+    for key in reversed(keys): # The oldest period is displayed first, so that the trend can be read from top to bottom.
+        print(f"{choice} statistics for {key}:")
+        # For a day, the habits that are active without an entry on the day itself are found in the weekly table of its week.
+        tables_to_search = [(statistics, key)]
+        if granularity == "daily":
+            tables_to_search.append((database["statistics"]["weekly"], period_keys(key)["weekly"]))
+        habits_in_period = {}
+        for table, table_key in tables_to_search:
+            for name, frequencies in table.get(table_key, {}).items():
+                habits_in_period.setdefault(name, set()).update(frequencies)
+
+        totals_by_frequency = {}
+        for name, frequencies in sorted(habits_in_period.items()):
+            for frequency in sorted(frequencies):
+                completed = statistics_counter(statistics, key, name, frequency, "completed")
+                if granularity == "daily":
+                    active = daily_active(database["statistics"], key, name, frequency)
+                else:
+                    active = statistics_counter(statistics, key, name, frequency, "active")
+                if key != current_key:
+                    timeouts = statistics_counter(statistics, key, name, frequency, "open_due") # All deadlines of a past period have already expired.
+                else:
+                    # In the current period, only the habits whose deadline was before today are timeouts.
+                    # These are taken from the tables of the previous days of the period (at most 30 days).
+                    timeouts = 0
+                    day = today - timedelta(days=1)
+                    while granularity != "daily" and period_keys(day.strftime('%Y-%m-%d'))[granularity] == key:
+                        timeouts += statistics_counter(database["statistics"]["daily"], day.strftime('%Y-%m-%d'), name, frequency, "open_due")
+                        day -= timedelta(days=1)
+                row = [completed, timeouts, active]
+                if not any(row): # e.g. a habit that ended earlier in the week
+                    continue
+                print_statistics_row(f"{name} ({frequency})", row)
+                totals = totals_by_frequency.setdefault(frequency, [0, 0, 0])
+                for position, value in enumerate(row):
+                    totals[position] += value
+        if not totals_by_frequency:
+            print("  There are no habits in this period.")
+        for frequency, totals in sorted(totals_by_frequency.items()):
+            print_statistics_row(f"All {frequency} habits", totals)
+    print(f"(Timeouts are only counted for deadlines before today, {date_today}.)")
+
+
+def statistics_counter(statistics_table, key, name, frequency, counter):
+    """
+    This function returns a single counter from a statistics table, or 0 if there is no entry for it.
+    """
+    return statistics_table.get(key, {}).get(name, {}).get(frequency, {}).get(counter, 0)
+
+
+def daily_active(statistics, date, name, frequency):
+    """
+    This function calculates how many habits of a name and frequency were active on a day.
+    Starting with the habits that were active in the week of the day, the habits that only started later in the week 
+    and the habits whose deadline was earlier in the week are subtracted. Only the weekly table and at most seven entries of the daily table are read.
+    """
+    day = datetime.strptime(date, '%Y-%m-%d')
+    active = statistics_counter(statistics["weekly"], period_keys(date)["weekly"], name, frequency, "active")
+    for days_after in range(1, 7 - day.weekday()): # The remaining days of the week up to Sunday
+        active -= statistics_counter(statistics["daily"], (day + timedelta(days=days_after)).strftime('%Y-%m-%d'), name, frequency, "started")
+    for days_before in range(1, day.weekday() + 1): # The days of the week from Monday onwards
+        active -= statistics_counter(statistics["daily"], (day - timedelta(days=days_before)).strftime('%Y-%m-%d'), name, frequency, "ended")
+    return active
+
+
+def print_statistics_row(label, row):
+    """
+    This function outputs one line of the statistics table. The row contains the number of completed habits, timeouts and active habits.
+    """
+    completed, timeouts, active = row
+    # The completion rate can only be calculated if at least one habit was completed or has expired.
+    completion_rate = f"{completed / (completed + timeouts):.0%}" if completed + timeouts else "-"
+    print(f"  {label}: Completed: {completed}, Timeouts: {timeouts}, Active: {active}, Completion rate: {completion_rate}")
+
+
+# This function allows the user to look back at a past date and see what the habit tracker would have shown on that day.
+def look_back_at_past_date(database):
+    """
+    This function shows the habits as they were on a past date. The user enters the date in the format YYYY-MM-DD 
+    and then selects which of the following evaluations should be carried out for this day:
+    - Show all habits (including which habits were already outdated on that day)
+    - Show me all habits with the same repetition interval
+    - Check urgent habits (habits whose deadline expired on that day)
+    - Show me the longest running streak overall (only completions up to that day)
+    """
+    as_of_date = questionary.text("Enter the date you want to look back at (format YYYY-MM-DD):").ask()
+    # The date is checked with strptime() so that an incorrect entry does not lead to a wrong comparison of the date strings.
+    try:
+        as_of_date = datetime.strptime(as_of_date, '%Y-%m-%d').strftime('%Y-%m-%d')
+    except ValueError:
+        print(f"Error: '{as_of_date}' is not a valid date in the format YYYY-MM-DD.")
+        return
+
+    choice = questionary.select(
+        f"What would you like to see as of {as_of_date}?",
+        choices=["Show all habits",
+                 "Show me all habits with the same repetition interval",
+                 "Check urgent habits",
+                 "Show me the longest running streak overall"]
+    ).ask()
+
+    if choice == "Show all habits":
+        show_habits(database, as_of_date)
+    elif choice == "Show me all habits with the same repetition interval":
+        show_same_freq_habits(database, as_of_date)
+    elif choice == "Check urgent habits":
+        check_for_urgent_habits(database, as_of_date)
+    elif choice == "Show me the longest running streak overall":
+        longest_streak_overall(database, as_of_date)
+
+
 # This function can be called up by the user to obtain help (in the form of the function's docstring) 
 # either via this function itself or via all other functions in the main menu.
 def help_and_explanations():
@@ -367,9 +920,16 @@ def help_and_explanations():
                  "Show all habits", 
                  "Show me all habits with the same repetition interval",    
                  "Show me the longest running streak overall",
+                 "Show statistics",
                  "Mark habit as completed", 
                  "Check urgent habits", 
+                 "Look back at a past date",
                  "Delete a habit",
+                 "Undo the last change",
+                 "Redo the last undone change",
+                 "Start a group of changes",
+                 "Save the group of changes",
+                 "Discard the group of changes",
                  "Change working directory", 
                  "Exit the program"]
     ).ask()
@@ -384,12 +944,26 @@ def help_and_explanations():
         help(show_same_freq_habits)
     elif choice == "Show me the longest running streak overall":
         help(longest_streak_overall)
+    elif choice == "Show statistics":
+        help(show_statistics)
     elif choice == "Mark habit as completed":
         help(mark_habit_as_completed)
     elif choice == "Check urgent habits":
         help(check_for_urgent_habits)
+    elif choice == "Look back at a past date":
+        help(look_back_at_past_date)
     elif choice == "Delete a habit":
         help(delete_habit)
+    elif choice == "Undo the last change":
+        help(undo_last_change)
+    elif choice == "Redo the last undone change":
+        help(redo_last_change)
+    elif choice == "Start a group of changes":
+        help(begin_transaction)
+    elif choice == "Save the group of changes":
+        help(commit_transaction)
+    elif choice == "Discard the group of changes":
+        help(rollback_transaction)
     elif choice == "Change working directory":
         help(change_working_directory)
     # As the exit option does not contain a function of its own, but ends the loop that is responsible for the actual 
@@ -399,6 +973,7 @@ def help_and_explanations():
               This option ends the program. 
               The previously saved habits are retained as they are saved in a JSON database with the name “habit_db.json”. 
               They can therefore be used again the next time the habit tracker is called.
+              If a group of changes has not been saved yet, you are asked whether it should be saved before the program is terminated.
               """)
 
 
@@ -410,9 +985,16 @@ def main_menu(database):
     - Show all habits
     - Show me all habits with the same repetition interval
     - Show me the longest running streak overall
+    - Show statistics
     - Mark habit as completed
     - Check urgent habits
+    - Look back at a past date
     - Delete a habit from the database
+    - Undo the last change
+    - Redo the last undone change
+    - Start a group of changes
+    - Save the group of changes
+    - Discard the group of changes
     - Change working directory
     - Exit the program
     """
@@ -429,9 +1011,16 @@ def main_menu(database):
                      "Show all habits", 
                      "Show me all habits with the same repetition interval",    
                      "Show me the longest running streak overall",
+                     "Show statistics",
                      "Mark habit as completed", 
                      "Check urgent habits", 
+                     "Look back at a past date",
                      "Delete a habit",
+                     "Undo the last change",
+                     "Redo the last undone change",
+                     "Start a group of changes",
+                     "Save the group of changes",
+                     "Discard the group of changes",
                      "Change working directory", 
                      "Exit the program"]
         ).ask()
@@ -448,17 +1037,37 @@ def main_menu(database):
             show_same_freq_habits(database)
         elif choice == "Show me the longest running streak overall":
             longest_streak_overall(database)
+        elif choice == "Show statistics":
+            show_statistics(database)
         elif choice == "Mark habit as completed": # In this part of the If-elif condition a user input is requested again.
             habit_id = int(questionary.text("Enter the ID of the habit you want to mark as completed:").ask()) # The user enters the ID of the habit that is to be marked as completed.
             mark_habit_as_completed(database, habit_id)
         elif choice == "Check urgent habits":
             check_for_urgent_habits(database)
+        elif choice == "Look back at a past date":
+            look_back_at_past_date(database)
         elif choice == "Delete a habit":
             habit_id = int(questionary.text("Enter the ID of the habit you want to delete:").ask()) # # The user enters the ID of the habit that is to be deleted
             delete_habit(database, habit_id)
+        elif choice == "Undo the last change":
+            undo_last_change(database)
+        elif choice == "Redo the last undone change":
+            redo_last_change(database)
+        elif choice == "Start a group of changes":
+            begin_transaction(database)
+        elif choice == "Save the group of changes":
+            commit_transaction(database)
+        elif choice == "Discard the group of changes":
+            rollback_transaction(database)
         elif choice == "Change working directory":
             change_working_directory()
         elif choice == "Exit the program":
+            # If a group of changes is still open, the user decides whether it should be saved before the program is terminated.
+            if edit_session["transaction_open"]:
+                if questionary.confirm("A group of changes has not been saved yet. Do you want to save it?").ask():
+                    commit_transaction(database)
+                else:
+                    rollback_transaction(database)
             print("The habit tracker is terminated")
             break # This break at the end of the condition for ending the program is necessary so that the program terminates when the user selects the corresponding menu entry.
 
@@ -0,0 +1,28 @@
+# This file contains the helper function that is shared by the tests which import the habit tracking app directly
+# (“test_of analytics.py”, “test_of_transactions.py” and “test_of_statistics.py”). It does not contain any tests itself.
+# The test database habits_db.json is only read. All changes made during the tests are saved in a temporary directory,
+# which is removed again when the tests are finished.
+
+import atexit
+import os
+import tempfile
+
+import habit_tracking_app as app
+
+# The path of the test database is determined relative to this file, so that the tests can be started from any working directory.
+test_database = os.path.join(os.path.dirname(os.path.abspath(__file__)), "habits_db.json")
+temporary_directory = tempfile.TemporaryDirectory()
+atexit.register(temporary_directory.cleanup) # The temporary directory and the database saved in it are deleted at the end
+temporary_database = os.path.join(temporary_directory.name, "habits_db.json")
+
+
+def load_test_database():
+    """
+    Loads the test database and resets the undo/redo lists, so that each test starts with the same state.
+    Afterwards, all saves are directed to a temporary file so that the test database is not changed.
+    """
+    app.habit_database = test_database
+    database = app.load_database()
+    app.habit_database = temporary_database
+    app.edit_session.update({"transaction_open": False, "pending_operations": [], "history_length": 0, "undo_stack": [], "redo_stack": []})
+    return database
@@ -0,0 +1,84 @@
+# In this test, the statistics tables of the habit tracking app are tested with the habits of the test database.
+# As in “test_of_transactions.py”, the code is imported from “habit_tracking_app.py” instead of being copied.
+# The test database is loaded with the helper function from “helper_for_tests.py”, so that it is only read and never changed.
+# I then used the “assert” statement to check whether the tables that are updated with every change are identical to tables
+# that are calculated again from all habits, and whether the figures for past periods match the habits in the test database.
+
+import habit_tracking_app as app
+from helper_for_tests import load_test_database
+
+
+# Unit Test Suite
+
+def test_incremental_statistics_match_rebuild():
+    database = load_test_database()
+    # A new habit is added in the same way as in create_a_habit, but without the user input.
+    habit = app.Habit("Lesen", 10, "Weekly")
+    habit.id = database["habits"][-1]["id"] + 1
+    habit.start = "2025-03-12"
+    habit.deadline = "2025-03-22"
+    app.perform_operation(database, {"action": "add", "habit": habit.to_dict(), "index": len(database["habits"])})
+    app.mark_habit_as_completed(database, habit.id)
+    app.mark_habit_as_completed(database, 30)
+    app.delete_habit(database, 3)
+    app.delete_habit(database, 6)
+    assert database["statistics"] == app.build_statistics(database["habits"]), "Expected the updated tables to match the rebuilt tables after the changes"
+    app.undo_last_change(database)
+    app.undo_last_change(database)
+    app.undo_last_change(database)
+    assert database["statistics"] == app.build_statistics(database["habits"]), "Expected the updated tables to match the rebuilt tables after undo"
+    print("test_incremental_statistics_match_rebuild passed.")
+
+def test_past_week():
+    database = load_test_database()
+    week = database["statistics"]["weekly"]["2025-W04"] # 20.01.2025 to 26.01.2025
+    assert week["Joggen"]["Daily"] == {"completed": 3, "active": 3}, f"Expected 3 completed and 3 active, but got {week['Joggen']['Daily']}"
+    assert week["Lernen"]["Daily"] == {"completed": 2, "active": 2}, f"Expected 2 completed and 2 active, but got {week['Lernen']['Daily']}"
+    assert week["Einkaufen"]["Weekly"] == {"open_due": 1, "active": 1}, f"Expected 1 open and 1 active, but got {week['Einkaufen']['Weekly']}"
+    print("test_past_week passed.")
+
+def test_past_month():
+    database = load_test_database()
+    month = database["statistics"]["monthly"]["2025-01"]
+    assert month["Joggen"]["Daily"] == {"completed": 5, "active": 5}, f"Expected 5 completed and 5 active, but got {month['Joggen']['Daily']}"
+    assert month["Lernen"]["Daily"] == {"completed": 2, "active": 2}, f"Expected 2 completed and 2 active, but got {month['Lernen']['Daily']}"
+    assert month["Einkaufen"]["Weekly"] == {"completed": 1, "open_due": 1, "active": 2}, f"Expected 1 completed, 1 open and 2 active, but got {month['Einkaufen']['Weekly']}"
+    print("test_past_month passed.")
+
+def test_daily_active():
+    database = load_test_database()
+    # On 24.01.2025 (a Friday), the Joggen habits 1 (23.01. to 24.01.) and 2 (24.01. to 25.01.) are active.
+    active = app.daily_active(database["statistics"], "2025-01-24", "Joggen", "Daily")
+    assert active == 2, f"Expected 2, but got {active}"
+    # On 27.01.2025 (a Monday), only the Lernen habit 4 (26.01. to 27.01.) is still active.
+    active = app.daily_active(database["statistics"], "2025-01-27", "Lernen", "Daily")
+    assert active == 1, f"Expected 1, but got {active}"
+    active = app.daily_active(database["statistics"], "2025-01-27", "Joggen", "Daily")
+    assert active == 0, f"Expected 0, but got {active}"
+    print("test_daily_active passed.")
+
+def test_long_habit_entries():
+    # A habit that runs for ten years (from Wednesday 01.01.2025 to Saturday 01.01.2035) should only create one entry per week and month, not per day.
+    habit = app.Habit("Sparen", 3652, "Monthly")
+    habit.id = 1
+    habit.start = "2025-01-01"
+    habit.deadline = "2035-01-01"
+    statistics = app.build_statistics([habit.to_dict()])
+    assert len(statistics["daily"]) == 2, f"Expected 2 daily entries (start and deadline), but got {len(statistics['daily'])}"
+    assert len(statistics["weekly"]) == 523, f"Expected 523 weekly entries, but got {len(statistics['weekly'])}" # From the week of 30.12.2024 to the week of 31.12.2034
+    assert len(statistics["monthly"]) == 121, f"Expected 121 monthly entries, but got {len(statistics['monthly'])}"
+    active = app.daily_active(statistics, "2030-06-15", "Sparen", "Monthly")
+    assert active == 1, f"Expected 1, but got {active}"
+    print("test_long_habit_entries passed.")
+
+
+# A function is created that executes all tests in sequence.
+def run_tests():
+    test_incremental_statistics_match_rebuild()
+    test_past_week()
+    test_past_month()
+    test_daily_active()
+    test_long_habit_entries()
+
+# Run all tests
+run_tests()
@@ -0,0 +1,81 @@
+# In this test, the functions for undo/redo and for groups of changes are tested directly in the habit tracking app.
+# In contrast to “test_of_class.py”, the code is not copied, but imported from “habit_tracking_app.py”, as it depends on several functions of the app.
+# The test database is loaded with the helper function from “helper_for_tests.py”, so that it is only read and never changed.
+# I then used the “assert” statement to check whether the habits, the change history and the number of saves are as expected.
+
+import copy
+
+import habit_tracking_app as app
+from helper_for_tests import load_test_database
+
+
+# Unit Test Suite
+
+def test_delete_undo_redo():
+    database = load_test_database()
+    original_habits = copy.deepcopy(database["habits"])
+    app.delete_habit(database, 3)
+    habits_after_delete = copy.deepcopy(database["habits"])
+    assert len(habits_after_delete) == len(original_habits) - 1, f"Expected {len(original_habits) - 1} habits, but got {len(habits_after_delete)}"
+    app.undo_last_change(database)
+    assert database["habits"] == original_habits, "Expected the deleted habit to be restored at its old position after undo"
+    app.redo_last_change(database)
+    assert database["habits"] == habits_after_delete, "Expected the habit to be deleted again after redo"
+    print("test_delete_undo_redo passed.")
+
+def test_undo_mark_completed():
+    database = load_test_database()
+    original_habits = copy.deepcopy(database["habits"])
+    app.mark_habit_as_completed(database, 30)
+    assert database["habits"][-1]["completed"] == True, f"Expected True, but got {database['habits'][-1]['completed']}"
+    app.undo_last_change(database)
+    assert database["habits"] == original_habits, "Expected the completion status to be reset after undo"
+    print("test_undo_mark_completed passed.")
+
+def test_rollback_transaction():
+    database = load_test_database()
+    original_habits = copy.deepcopy(database["habits"])
+    history_length = len(database["history"])
+    checkpoint_count = len(database["checkpoints"])
+    app.begin_transaction(database)
+    app.delete_habit(database, 5)
+    # Enough changes are made so that a new checkpoint is created during the group.
+    for _ in range(app.history_checkpoint_interval):
+        app.mark_habit_as_completed(database, 30)
+    assert len(database["checkpoints"]) > checkpoint_count, "Expected a new checkpoint to be created during the group"
+    app.rollback_transaction(database)
+    assert database["habits"] == original_habits, "Expected the habits to be unchanged after the rollback"
+    assert len(database["history"]) == history_length, f"Expected {history_length} history entries, but got {len(database['history'])}"
+    assert len(database["checkpoints"]) == checkpoint_count, f"Expected {checkpoint_count} checkpoints, but got {len(database['checkpoints'])}"
+    assert app.edit_session["undo_stack"] == [], "Expected nothing to undo after the rollback"
+    print("test_rollback_transaction passed.")
+
+def test_commit_saves_once():
+    database = load_test_database()
+    original_save_database = app.save_database
+    saves = []
+    # save_database is replaced by a function that counts the calls and then saves as usual.
+    app.save_database = lambda database_to_save: (saves.append(1), original_save_database(database_to_save))
+    try:
+        app.begin_transaction(database)
+        app.mark_habit_as_completed(database, 30)
+        app.delete_habit(database, 1)
+        app.delete_habit(database, 2)
+        assert len(saves) == 0, f"Expected no save before the commit, but got {len(saves)}"
+        app.commit_transaction(database)
+        assert len(saves) == 1, f"Expected exactly 1 save, but got {len(saves)}"
+    finally:
+        app.save_database = original_save_database
+    assert len(app.edit_session["undo_stack"]) == 1, f"Expected 1 group on the undo list, but got {len(app.edit_session['undo_stack'])}"
+    print("test_commit_saves_once passed.")
+
+
+# A function is created that executes all tests in sequence.
+def run_tests():
+    test_delete_undo_redo()
+    test_undo_mark_completed()
+    test_rollback_transaction()
+    test_commit_saves_once()
+
+# Run all tests
+run_tests()